@@ -1,8 +1,47 @@
 import streamlit as st
-import pandas as pd
 import groq
+import httpx
+import asyncio
+import csv
+import hashlib
+import importlib.util
+import orjson
+import re
+import threading
+import time
+from collections import OrderedDict
 from io import StringIO
-import os
+import tiktoken
+from groq_client import (
+    GZIP_REQUESTS, REQUEST_TIMEOUT, AsyncGzipTransport, create_completion, create_completion_async,
+    get_groq_api_key, init_groq_client
+)
+
+# Answers are reused for an hour, for at most this many distinct questions
+RESPONSE_CACHE_TTL = 3600
+RESPONSE_CACHE_SIZE = 512
+
+# HTTP/2 needs the optional h2 package (httpx[http2]); without it batches
+# still run concurrently over pooled HTTP/1.1 connections
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Leave room in the 8k-token context for instructions, question and answer
+FILE_TOKEN_BUDGET = 6000
+CSV_CHUNK_ROWS = 50
+# Chunks are cut down to about this many tokens so retrieval can pick them
+CHUNK_TOKENS = 500
+# Per-upload artifacts kept process-wide, for the most recent uploads only
+UPLOAD_CACHE_ENTRIES = 8
+
+# Context windows of the selectable models; the others have 8k
+MODEL_CONTEXT_WINDOWS = {"mixtral-8x7b-32768": 32768}
+DEFAULT_CONTEXT_WINDOW = 8192
+# Completion tokens set aside per question in a batched request
+BATCH_ANSWER_TOKENS = 400
+# Prompt sizes are cl100k estimates; the models' own tokenizers can produce
+# more (Gemma splits every digit), so scale them up and keep spare tokens
+TOKENIZER_SLACK = 1.3
+CONTEXT_MARGIN = 64
 
 # Set page config
 st.set_page_config(
@@ -11,58 +50,182 @@ st.set_page_config(
     layout="wide"
 )
 
-# Initialize Groq client with better error handling
 @st.cache_resource
-def init_groq_client(api_key):
-    if not api_key:
-        return None
-    try:
-        return groq.Groq(api_key=api_key)
-    except Exception as e:
-        st.error(f"Error initializing Groq client: {str(e)}")
-        return None
+def get_response_cache():
+    """Process-wide answer cache shared by all sessions"""
+    return threading.Lock(), OrderedDict()
+
+def get_cached_answer(key):
+    """Return a fresh cached answer for (model, file hash, question), if any"""
+    lock, answers = get_response_cache()
+    with lock:
+        entry = answers.get(key)
+        if entry and time.time() - entry[0] < RESPONSE_CACHE_TTL:
+            return entry[1]
+    return None
+
+def store_answer(key, answer):
+    """Cache an answer, evicting the oldest entries beyond the size limit"""
+    lock, answers = get_response_cache()
+    with lock:
+        answers[key] = (time.time(), answer)
+        answers.move_to_end(key)
+        while len(answers) > RESPONSE_CACHE_SIZE:
+            answers.popitem(last=False)
 
-def get_groq_api_key():
-    """Get API key from various sources"""
-    # Try to get from environment variable first
-    api_key = os.getenv("GROQ_API_KEY")
+def get_file_sha(uploaded_file):
+    """Hash the raw uploaded bytes once per upload for use in cache keys"""
+    if st.session_state.get("file_sha_id") != uploaded_file.file_id:
+        # Hash the upload buffer in place rather than a decoded or serialized copy
+        with uploaded_file.getbuffer() as buffer:
+            st.session_state.file_sha = hashlib.sha256(buffer).hexdigest()
+        st.session_state.file_sha_id = uploaded_file.file_id
+    return st.session_state.file_sha
+
+def parse_file(file_bytes, file_name, mime_type):
+    """Decode uploaded bytes into text based on file type"""
+    if mime_type == "text/plain":
+        # Read TXT file
+        return file_bytes.decode("utf-8"), "txt"
     
-    # If not found in env, try streamlit secrets (with error handling)
-    if not api_key:
-        try:
-            api_key = st.secrets["GROQ_API_KEY"]
-        except:
-            api_key = None
+    elif mime_type == "text/csv" or file_name.endswith('.csv'):
+        # CSV is already compact text for the model; no DataFrame needed
+        return file_bytes.decode("utf-8"), "csv"
     
-    return api_key
+    else:
+        return None, None
+
+@st.cache_data(show_spinner=False, max_entries=UPLOAD_CACHE_ENTRIES)
+def load_csv_preview(content_hash, _file_content, rows=10):
+    """Parse only the first rows for display and count the rest with the csv module"""
+    # pandas is heavy to import, so only CSV previews pay for it
+    import pandas as pd
+    
+    head = pd.read_csv(StringIO(_file_content), nrows=rows)
+    total_rows = sum(1 for row in csv.reader(StringIO(_file_content)) if row) - 1
+    return head, total_rows
 
 def read_file_content(uploaded_file):
-    """Read and return file content based on file type"""
+    """Read and return file content based on file type, once per upload"""
+    # Reruns with the same upload reuse the decoded content
+    if st.session_state.get("file_key") == uploaded_file.file_id:
+        return st.session_state.file_content, st.session_state.file_type
+    
     try:
-        if uploaded_file.type == "text/plain":
-            # Read TXT file
-            stringio = StringIO(uploaded_file.getvalue().decode("utf-8"))
-            content = stringio.read()
-            return content, "txt"
-        
-        elif uploaded_file.type == "text/csv" or uploaded_file.name.endswith('.csv'):
-            # Read CSV file
-            df = pd.read_csv(uploaded_file)
-            content = df.to_string(index=False)
-            return content, "csv"
-        
-        else:
-            return None, None
+        content, file_type = parse_file(uploaded_file.getvalue(), uploaded_file.name, uploaded_file.type)
     except Exception as e:
         st.error(f"Error reading file: {str(e)}")
         return None, None
+    
+    if content is not None:
+        st.session_state.file_key = uploaded_file.file_id
+        st.session_state.file_content = content
+        st.session_state.file_type = file_type
+    return content, file_type
 
-def get_answer_from_groq(question, file_content, model_name, client):
-    """Get answer from Groq API based on file content"""
-    if not client:
-        return "Error: Groq client not initialized. Please check your API key."
+@st.cache_resource
+def get_encoder():
+    """Load the tokenizer's BPE ranks once per process"""
+    return tiktoken.get_encoding("cl100k_base")
+
+@st.cache_data(show_spinner=False, max_entries=UPLOAD_CACHE_ENTRIES)
+def count_tokens(content_hash, _file_content):
+    """Tokenize the file once per upload to size it against the budget"""
+    return len(get_encoder().encode(_file_content))
+
+def split_chunk(enc, text):
+    """Cut text into pieces of at most CHUNK_TOKENS tokens, on line boundaries where possible"""
+    tokens = enc.encode(text)
+    if len(tokens) <= CHUNK_TOKENS:
+        return [(text, len(tokens))]
     
-    prompt = f"""
+    # Line sizes count one extra token for the newline that joins them
+    pieces, lines, size = [], [], 0
+    for line in text.splitlines():
+        line_tokens = enc.encode(line)
+        if lines and size + len(line_tokens) + 1 > CHUNK_TOKENS:
+            pieces.append("\n".join(lines))
+            lines, size = [], 0
+        
+        if len(line_tokens) > CHUNK_TOKENS:
+            # A single oversized line is cut into fixed token windows
+            for i in range(0, len(line_tokens), CHUNK_TOKENS):
+                pieces.append(enc.decode(line_tokens[i:i + CHUNK_TOKENS]))
+        else:
+            lines.append(line)
+            size += len(line_tokens) + 1
+    
+    if lines:
+        pieces.append("\n".join(lines))
+    
+    # Record the real size of each piece as it will be sent
+    return [(piece, len(enc.encode(piece))) for piece in pieces]
+
+def count_prompt_tokens(messages):
+    """Approximate the prompt tokens of a chat request, role framing included"""
+    enc = get_encoder()
+    return sum(len(enc.encode(message["content"])) + 4 for message in messages) + 3
+
+# A read-only index shared by reference: st.cache_data would unpickle a full
+# copy of every chunk on each question
+@st.cache_resource(show_spinner=False, max_entries=UPLOAD_CACHE_ENTRIES)
+def chunk_file(content_hash, _file_content, file_type):
+    """Split an over-budget file into token-counted chunks once per upload"""
+    enc = get_encoder()
+    
+    if file_type == "csv":
+        # Keep the header row and group data rows
+        header, *rows = _file_content.splitlines()
+        chunks = ["\n".join(rows[i:i + CSV_CHUNK_ROWS]) for i in range(0, len(rows), CSV_CHUNK_ROWS)]
+    else:
+        header = ""
+        chunks = [p for p in re.split(r"\n\s*\n", _file_content) if p.strip()]
+    
+    # Paragraphs or row groups can still be huge (e.g. one record per line in
+    # a .txt), so window them until every chunk is small enough to select
+    pieces = [piece for chunk in chunks for piece in split_chunk(enc, chunk)]
+    
+    return header, len(enc.encode(header)), tuple(
+        (piece, n_tokens, frozenset(re.findall(r"\w+", piece.lower())))
+        for piece, n_tokens in pieces
+    )
+
+@st.cache_resource(show_spinner=False, max_entries=UPLOAD_CACHE_ENTRIES)
+def head_excerpt(content_hash, _file_content):
+    """The first FILE_TOKEN_BUDGET tokens of the file, computed once per upload"""
+    enc = get_encoder()
+    return enc.decode(enc.encode(_file_content)[:FILE_TOKEN_BUDGET])
+
+def select_relevant_content(question, file_content, file_type, content_hash):
+    """Fit the file into the token budget, keeping the chunks most relevant to the question"""
+    if count_tokens(content_hash, file_content) <= FILE_TOKEN_BUDGET:
+        return file_content
+    
+    header, header_tokens, chunks = chunk_file(content_hash, file_content, file_type)
+    
+    # Rank chunks by how many of the question's words they contain
+    terms = set(re.findall(r"\w+", question.lower()))
+    ranked = sorted(range(len(chunks)), key=lambda i: -len(terms & chunks[i][2]))
+    
+    # Each selected chunk also costs the newline it is joined with
+    budget = FILE_TOKEN_BUDGET - header_tokens
+    selected = []
+    for i in ranked:
+        if chunks[i][1] + 1 <= budget:
+            selected.append(i)
+            budget -= chunks[i][1] + 1
+    
+    if not selected:
+        # Nothing fits next to the header: fall back to the head of the file
+        return head_excerpt(content_hash, file_content) + "\n[... file truncated: only its beginning is shown ...]"
+    
+    # Splice the selected chunks back in file order
+    excerpt = "\n".join(([header] if header else []) + [chunks[i][0] for i in sorted(selected)])
+    return excerpt + "\n[... file truncated to the parts most relevant to the question ...]"
+
+def build_system_prompt(file_content):
+    """Build the instructions and file content sent ahead of every question"""
+    return f"""
     You are an AI assistant that answers questions based ONLY on the provided file content. 
     
     IMPORTANT RULES:
@@ -70,28 +233,268 @@ def get_answer_from_groq(question, file_content, model_name, client):
     2. If the answer is not in the file content, clearly state "I cannot find this information in the uploaded file"
     3. Do not provide information from your general knowledge
     4. Be specific and reference the relevant parts of the file when answering
+    5. Tabular files are given as CSV: the first line holds the column names and each following line is one row
+    
+    Please provide answers based only on the file content below.
     
     FILE CONTENT:
     {file_content}
+    """
+
+def get_system_prompt(file_content, content_hash):
+    """Build the whole-file system prompt once per upload"""
+    if st.session_state.get("system_prompt_hash") != content_hash:
+        st.session_state.system_prompt_hash = content_hash
+        st.session_state.system_prompt = build_system_prompt(file_content)
+    return st.session_state.system_prompt
+
+def build_messages(question, file_content, file_type, content_hash, query=None):
+    """Build the chat messages that ground a question in the file content"""
+    # query overrides the text that over-budget files are searched with
+    context = select_relevant_content(query or question, file_content, file_type, content_hash)
     
-    QUESTION: {question}
+    # When the whole file fits, every question shares an identical system
+    # prompt, which lets the server reuse its cached prefill for that prefix
+    if context is file_content:
+        system_prompt = get_system_prompt(file_content, content_hash)
+    else:
+        system_prompt = build_system_prompt(context)
     
-    Please provide an answer based only on the file content above.
-    """
+    return [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": question}
+    ]
+
+def get_answer_from_groq(question, file_content, file_type, content_hash, model_name, client):
+    """Stream the answer from Groq API based on file content, chunk by chunk"""
+    cache_key = (model_name, content_hash, question)
+    cached = get_cached_answer(cache_key)
+    if cached is not None:
+        yield cached
+        return
+    
+    if not client:
+        yield "Error: Groq client not initialized. Please check your API key."
+        return
     
     try:
-        response = client.chat.completions.create(
+        response = create_completion(
+            client,
             model=model_name,
-            messages=[
-                {"role": "system", "content": "You are a helpful assistant that answers questions based only on provided file content."},
-                {"role": "user", "content": prompt}
-            ],
+            messages=build_messages(question, file_content, file_type, content_hash),
             max_tokens=1000,
-            temperature=0.1
+            temperature=0.1,
+            stream=True
         )
-        return response.choices[0].message.content
+        parts = []
+        for chunk in response:
+            delta = chunk.choices[0].delta.content
+            if delta:
+                parts.append(delta)
+                yield delta
+        store_answer(cache_key, "".join(parts))
     except Exception as e:
-        return f"Error getting response: {str(e)}"
+        yield f"Error getting response: {str(e)}"
+
+async def _answer_concurrently(questions, file_content, file_type, content_hash, model_name, api_key):
+    # The async client is bound to the event loop, so it lives for one batch;
+    # with HTTP/2 the whole batch is multiplexed over a single TLS connection
+    limits = httpx.Limits(max_connections=32, max_keepalive_connections=16)
+    timeout = httpx.Timeout(REQUEST_TIMEOUT[1], connect=REQUEST_TIMEOUT[0])
+    # A custom transport takes over the client's connection settings
+    transport = AsyncGzipTransport(http2=HTTP2_AVAILABLE, limits=limits) if GZIP_REQUESTS else None
+    async with httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE, limits=limits, timeout=timeout, transport=transport
+    ) as http_client:
+        client = groq.AsyncGroq(api_key=api_key, http_client=http_client, max_retries=0)
+        
+        async def ask(question):
+            try:
+                response = await create_completion_async(
+                    client,
+                    model=model_name,
+                    messages=build_messages(question, file_content, file_type, content_hash),
+                    max_tokens=1000,
+                    temperature=0.1
+                )
+                answer = response.choices[0].message.content
+                store_answer((model_name, content_hash, question), answer)
+                return answer
+            except Exception as e:
+                return f"Error getting response: {str(e)}"
+        
+        return await asyncio.gather(*[ask(question) for question in questions])
+
+def get_answers_from_groq(questions, file_content, file_type, content_hash, model_name, api_key):
+    """Answer several questions about the file in parallel, in input order"""
+    answers = [get_cached_answer((model_name, content_hash, q)) for q in questions]
+    pending = [i for i, answer in enumerate(answers) if answer is None]
+    
+    # Only questions without a cached answer go to the API
+    if pending:
+        fresh = asyncio.run(_answer_concurrently(
+            [questions[i] for i in pending], file_content, file_type, content_hash, model_name, api_key
+        ))
+        for i, answer in zip(pending, fresh):
+            answers[i] = answer
+    
+    return answers
+
+def build_batch_prompt(questions):
+    """Ask for every question's answer in one JSON reply"""
+    numbered = "\n".join(f"{n}. {question}" for n, question in enumerate(questions, 1))
+    return (
+        f"Answer each of these questions separately:\n{numbered}\n\n"
+        'Reply with a JSON object of the form {"answers": [{"q": "<question>", "a": "<answer>"}]}, '
+        "with one entry per question, in the same order."
+    )
+
+def get_batched_answers_from_groq(questions, file_content, file_type, content_hash, model_name, client, api_key):
+    """Answer several questions about the file in as few requests as fit the model's context"""
+    answers = [get_cached_answer((model_name, content_hash, q)) for q in questions]
+    pending = [i for i, answer in enumerate(answers) if answer is None]
+    context_window = MODEL_CONTEXT_WINDOWS.get(model_name, DEFAULT_CONTEXT_WINDOW)
+    
+    while pending:
+        # Shrink the batch until room is left for every answer next to the prompt;
+        # each request prefills the file once for the whole batch
+        size = len(pending)
+        while True:
+            batch = pending[:size]
+            batch_questions = [questions[i] for i in batch]
+            # Search the file with the questions alone, not the JSON instructions
+            messages = build_messages(
+                build_batch_prompt(batch_questions), file_content, file_type, content_hash,
+                query="\n".join(batch_questions)
+            )
+            prompt_tokens = int(count_prompt_tokens(messages) * TOKENIZER_SLACK)
+            room = context_window - prompt_tokens - CONTEXT_MARGIN
+            if size == 1 or room >= BATCH_ANSWER_TOKENS * size:
+                break
+            size = max(1, min(size - 1, room // BATCH_ANSWER_TOKENS))
+        pending = pending[size:]
+        
+        try:
+            response = create_completion(
+                client,
+                model=model_name,
+                messages=messages,
+                max_tokens=max(1, min(room, 1000 * size)),
+                temperature=0.1,
+                response_format={"type": "json_object"}
+            )
+        except groq.APIError as e:
+            # Auth, rate-limit and validation errors would fail per question too
+            for i in batch:
+                answers[i] = f"Error getting response: {str(e)}"
+            continue
+        
+        try:
+            items = orjson.loads(response.choices[0].message.content)["answers"]
+            if len(items) != len(batch):
+                raise ValueError(f"expected {len(batch)} answers, got {len(items)}")
+            batch_answers = [str(item["a"]) for item in items]
+        except (KeyError, TypeError, ValueError):
+            # Malformed or partial reply: ask this batch's questions one by one
+            batch_answers = get_answers_from_groq(
+                [questions[i] for i in batch], file_content, file_type, content_hash, model_name, api_key
+            )
+            for i, answer in zip(batch, batch_answers):
+                answers[i] = answer
+            continue
+        
+        for i, answer in zip(batch, batch_answers):
+            answers[i] = answer
+            store_answer((model_name, content_hash, questions[i]), answer)
+    
+    return answers
+
+def clear_chat():
+    """Reset only the chat; file content, hash and prompt caches stay valid"""
+    st.session_state.messages = []
+
+# Chat runs as a fragment: sending a question reruns only this section, not
+# the upload, parsing and sidebar code around it
+@st.fragment
+def chat_section(file_content, file_type, content_hash, selected_model, client, api_key):
+    """Render the chat history and question inputs for the uploaded file"""
+    st.header("💬 Ask Questions About Your File")
+    
+    # Display chat history
+    for message in st.session_state.messages:
+        with st.chat_message(message["role"]):
+            st.markdown(message["content"])
+    
+    # Chat input
+    if prompt := st.chat_input("Ask a question about your uploaded file..."):
+        # Add user message to chat history
+        st.session_state.messages.append({"role": "user", "content": prompt})
+        with st.chat_message("user"):
+            st.markdown(prompt)
+    
+        # Stream AI response token by token
+        with st.chat_message("assistant"):
+            response = st.write_stream(
+                get_answer_from_groq(prompt, file_content, file_type, content_hash, selected_model, client)
+            )
+    
+        # Add assistant response to chat history
+        st.session_state.messages.append({"role": "assistant", "content": response})
+    
+    # Alternative input method with button
+    st.markdown("---")
+    st.subheader("💬 Alternative Input Method")
+    col1, col2 = st.columns([4, 1])
+    
+    with col1:
+        question = st.text_input("Type your question here:", key="question_input")
+    
+    with col2:
+        ask_button = st.button("Ask", type="primary")
+    
+    if ask_button and question:
+        # Add user message to chat history
+        st.session_state.messages.append({"role": "user", "content": question})
+    
+        # Get and display AI response
+        with st.spinner("Getting answer from your file..."):
+            response = "".join(get_answer_from_groq(question, file_content, file_type, content_hash, selected_model, client))
+    
+        # Add assistant response to chat history
+        st.session_state.messages.append({"role": "assistant", "content": response})
+    
+        # Clear the input and rerun
+        st.rerun(scope="fragment")
+    
+    # Batch input: answer several questions in one request or in parallel
+    st.markdown("---")
+    st.subheader("📋 Batch Questions")
+    batch_text = st.text_area(
+        "One question per line:",
+        key="batch_input",
+        help="Ask several questions about the file at once"
+    )
+    single_request = st.checkbox(
+        "Answer all in one request",
+        value=True,
+        help="Cheaper, since the file is sent once for the whole batch. Untick to send the questions in parallel."
+    )
+    
+    if st.button("Ask All") and batch_text.strip():
+        questions = [q.strip() for q in batch_text.splitlines() if q.strip()]
+    
+        with st.spinner(f"Answering {len(questions)} questions..."):
+            if single_request:
+                answers = get_batched_answers_from_groq(questions, file_content, file_type, content_hash, selected_model, client, api_key)
+            else:
+                answers = get_answers_from_groq(questions, file_content, file_type, content_hash, selected_model, api_key)
+    
+        # Add each question/answer pair to chat history
+        for question, answer in zip(questions, answers):
+            st.session_state.messages.append({"role": "user", "content": question})
+            st.session_state.messages.append({"role": "assistant", "content": answer})
+    
+        st.rerun(scope="fragment")
 
 def main():
     st.title("📄 File-Based Q&A Assistant")
@@ -170,14 +573,17 @@ def main():
             file_content, file_type = read_file_content(uploaded_file)
         
         if file_content is not None:
+            content_hash = get_file_sha(uploaded_file)
+            
             # Display file preview
             with st.expander("📖 Preview File Content", expanded=False):
                 if file_type == "csv":
-                    # Re-read for display
-                    uploaded_file.seek(0)
-                    df = pd.read_csv(uploaded_file)
-                    st.dataframe(df.head(10))
-                    st.info(f"Showing first 10 rows. Total rows: {len(df)}")
+                    try:
+                        head, total_rows = load_csv_preview(content_hash, file_content)
+                        st.dataframe(head)
+                        st.info(f"Showing first {len(head)} rows. Total rows: {total_rows}")
+                    except Exception as e:
+                        st.warning(f"Could not preview CSV as a table: {str(e)}")
                 else:
                     st.text_area("File Content", file_content[:1000] + "..." if len(file_content) > 1000 else file_content, height=200)
             
@@ -186,58 +592,11 @@ def main():
                 st.session_state.messages = []
             
             # Chat interface
-            st.header("💬 Ask Questions About Your File")
-            
-            # Display chat history
-            for message in st.session_state.messages:
-                with st.chat_message(message["role"]):
-                    st.markdown(message["content"])
+            chat_section(file_content, file_type, content_hash, selected_model, client, api_key)
             
-            # Chat input
-            if prompt := st.chat_input("Ask a question about your uploaded file..."):
-                # Add user message to chat history
-                st.session_state.messages.append({"role": "user", "content": prompt})
-                with st.chat_message("user"):
-                    st.markdown(prompt)
-                
-                # Get AI response
-                with st.chat_message("assistant"):
-                    with st.spinner("Thinking..."):
-                        response = get_answer_from_groq(prompt, file_content, selected_model, client)
-                    st.markdown(response)
-                
-                # Add assistant response to chat history
-                st.session_state.messages.append({"role": "assistant", "content": response})
-            
-            # Alternative input method with button
-            st.markdown("---")
-            st.subheader("💬 Alternative Input Method")
-            col1, col2 = st.columns([4, 1])
-            
-            with col1:
-                question = st.text_input("Type your question here:", key="question_input")
-            
-            with col2:
-                ask_button = st.button("Ask", type="primary")
-            
-            if ask_button and question:
-                # Add user message to chat history
-                st.session_state.messages.append({"role": "user", "content": question})
-                
-                # Get and display AI response
-                with st.spinner("Getting answer from your file..."):
-                    response = get_answer_from_groq(question, file_content, selected_model, client)
-                
-                # Add assistant response to chat history
-                st.session_state.messages.append({"role": "assistant", "content": response})
-                
-                # Clear the input and rerun
-                st.rerun()
-            
-            # Clear chat button
-            if st.sidebar.button("🗑️ Clear Chat History"):
-                st.session_state.messages = []
-                st.rerun()
+            # Clear chat button; the callback runs before the rerun the click
+            # already triggers, so no second rerun is needed
+            st.sidebar.button("🗑️ Clear Chat History", on_click=clear_chat)
         
         else:
             st.error("❌ Could not read the file. Please make sure it's a valid TXT or CSV file.")
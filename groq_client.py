@@ -0,0 +1,229 @@
+import asyncio
+import gzip
+import os
+import time
+import groq
+import httpx
+import orjson
+import requests
+import streamlit as st
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+GROQ_URL = "https://api.groq.com/openai/v1/chat/completions"
+DEFAULT_MODEL = "llama-3.3-70b-versatile"
+
+# (connect, read) timeouts so a hung connection can't block the script thread
+REQUEST_TIMEOUT = (3.05, 60)
+MAX_RETRIES = 4
+RETRY_BACKOFF = 0.4
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Groq doesn't document gzip request bodies, so compression is opt-in: set
+# GROQ_GZIP_REQUESTS=1 once the endpoint is known to accept them. Bodies at
+# least GZIP_MIN_BYTES large are then compressed, at a level that stays fast
+# on multi-MB prompts
+GZIP_REQUESTS = os.getenv("GROQ_GZIP_REQUESTS") == "1"
+GZIP_MIN_BYTES = 16 * 1024
+GZIP_LEVEL = 5
+
+def get_groq_api_key():
+    """Get API key from various sources"""
+    # Try to get from environment variable first
+    api_key = os.getenv("GROQ_API_KEY")
+
+    # If not found in env, try streamlit secrets (with error handling)
+    if not api_key:
+        try:
+            api_key = st.secrets["GROQ_API_KEY"]
+        except:
+            api_key = None
+
+    return api_key
+
+# Reuse one keep-alive connection pool across reruns and pages instead of
+# paying a fresh TCP+TLS handshake to api.groq.com on every turn
+@st.cache_resource
+def get_session(api_key):
+    session = requests.Session()
+    session.headers.update({
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json"
+    })
+    # Chat completions are POSTs, which urllib3 won't retry unless told to.
+    # Read timeouts are not retried: the request may already be generating
+    # (and billed), and resending it would multiply the wait
+    retry = Retry(
+        total=MAX_RETRIES,
+        read=0,
+        backoff_factor=RETRY_BACKOFF,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset(["POST"]),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+    session.mount("https://", adapter)
+    return session
+
+@st.cache_resource
+def get_gzip_state():
+    """Remember, per process, whether the API refused gzip request bodies"""
+    return {"rejected": False}
+
+def should_gzip(body):
+    """Whether a request body should go out gzip-compressed"""
+    return GZIP_REQUESTS and len(body) >= GZIP_MIN_BYTES and not get_gzip_state()["rejected"]
+
+def post_to_groq(api_key, payload, stream=False):
+    """POST a chat payload, gzip-compressing large bodies when enabled"""
+    session = get_session(api_key)
+    body = orjson.dumps(payload)
+
+    if not should_gzip(body):
+        return session.post(GROQ_URL, data=body, timeout=REQUEST_TIMEOUT, stream=stream)
+
+    response = session.post(
+        GROQ_URL,
+        data=gzip.compress(body, compresslevel=GZIP_LEVEL),
+        headers={"Content-Encoding": "gzip"},
+        timeout=REQUEST_TIMEOUT,
+        stream=stream,
+    )
+    if response.status_code != 415:
+        return response
+
+    # 415 Unsupported Media Type: the API won't take gzip bodies, so resend
+    # this one plain and stop compressing
+    response.close()
+    get_gzip_state()["rejected"] = True
+    return session.post(GROQ_URL, data=body, timeout=REQUEST_TIMEOUT, stream=stream)
+
+def gzip_request(request):
+    """Copy an httpx request with its body gzip-compressed"""
+    body = gzip.compress(request.content, compresslevel=GZIP_LEVEL)
+    headers = request.headers.copy()
+    headers["Content-Encoding"] = "gzip"
+    headers["Content-Length"] = str(len(body))
+    return httpx.Request(request.method, request.url, headers=headers, content=body, extensions=request.extensions)
+
+# The Groq SDK sends through httpx, so its file-grounded prompts are
+# compressed by these transports, with the same 415 fallback as post_to_groq
+class GzipTransport(httpx.HTTPTransport):
+    def handle_request(self, request):
+        if not should_gzip(request.read()):
+            return super().handle_request(request)
+
+        response = super().handle_request(gzip_request(request))
+        if response.status_code != 415:
+            return response
+
+        response.close()
+        get_gzip_state()["rejected"] = True
+        return super().handle_request(request)
+
+class AsyncGzipTransport(httpx.AsyncHTTPTransport):
+    async def handle_async_request(self, request):
+        if not should_gzip(await request.aread()):
+            return await super().handle_async_request(request)
+
+        response = await super().handle_async_request(gzip_request(request))
+        if response.status_code != 415:
+            return response
+
+        await response.aclose()
+        get_gzip_state()["rejected"] = True
+        return await super().handle_async_request(request)
+
+# Initialize Groq client with better error handling
+@st.cache_resource
+def init_groq_client(api_key):
+    if not api_key:
+        return None
+    try:
+        return groq.Groq(
+            api_key=api_key,
+            timeout=httpx.Timeout(REQUEST_TIMEOUT[1], connect=REQUEST_TIMEOUT[0]),
+            http_client=httpx.Client(transport=GzipTransport()) if GZIP_REQUESTS else None,
+            # The SDK would also resend after read timeouts; create_completion
+            # retries only what is safe to resend
+            max_retries=0
+        )
+    except Exception as e:
+        st.error(f"Error initializing Groq client: {str(e)}")
+        return None
+
+def retry_delay(error, attempt):
+    """Seconds to wait before retrying a failed SDK call, or None to give up"""
+    if attempt >= MAX_RETRIES:
+        return None
+    if isinstance(error, groq.APIStatusError):
+        retryable = error.status_code in RETRY_STATUSES
+    elif isinstance(error, groq.APIConnectionError):
+        # Only failures to connect: after a read timeout or a dropped response
+        # the completion may already be generating (and billed)
+        retryable = isinstance(error.__cause__, (httpx.ConnectError, httpx.ConnectTimeout))
+    else:
+        retryable = False
+    return RETRY_BACKOFF * 2 ** attempt if retryable else None
+
+def create_completion(client, **kwargs):
+    """Call chat.completions.create, retrying connect failures and 429/5xx only"""
+    attempt = 0
+    while True:
+        try:
+            return client.chat.completions.create(**kwargs)
+        except groq.APIError as e:
+            delay = retry_delay(e, attempt)
+            if delay is None:
+                raise
+        time.sleep(delay)
+        attempt += 1
+
+async def create_completion_async(client, **kwargs):
+    """Async create_completion for groq.AsyncGroq clients"""
+    attempt = 0
+    while True:
+        try:
+            return await client.chat.completions.create(**kwargs)
+        except groq.APIError as e:
+            delay = retry_delay(e, attempt)
+            if delay is None:
+                raise
+        await asyncio.sleep(delay)
+        attempt += 1
+
+def chat_with_groq(api_key, messages, model=DEFAULT_MODEL, temperature=0.7):
+    """Return the assistant reply, or None after showing the error"""
+    payload = {
+        "model": model,
+        "messages": messages,
+        "temperature": temperature,
+    }
+    response = post_to_groq(api_key, payload)
+    if response.status_code != 200:
+        st.error(f"Error: {response.status_code} - {response.text}")
+        return None
+    response.raise_for_status()
+    return orjson.loads(response.content)["choices"][0]["message"]["content"]
+
+def stream_chat_with_groq(api_key, messages, model=DEFAULT_MODEL, temperature=0.7):
+    """Yield the assistant reply as it streams in over server-sent events."""
+    payload = {
+        "model": model,
+        "messages": messages,
+        "temperature": temperature,
+        "stream": True,
+    }
+    with post_to_groq(api_key, payload, stream=True) as response:
+        if response.status_code != 200:
+            st.error(f"Error: {response.status_code} - {response.text}")
+            return
+        for line in response.iter_lines():
+            if not line.startswith(b"data: "):
+                continue
+            data = line[len(b"data: "):]
+            if data == b"[DONE]":
+                break
+            delta = orjson.loads(data)["choices"][0]["delta"].get("content")
+            if delta:
+                yield delta
@@ -0,0 +1,10 @@
+import streamlit as st
+
+# One process serves every view, so the pooled Groq session and client in
+# groq_client.py are shared across pages instead of built per app
+page = st.navigation([
+    st.Page("app3.py", title="File Q&A", icon="📄", default=True),
+    st.Page("app2.py", title="Chat", icon="💬"),
+    st.Page("app.py", title="Quick Prompt", icon="🤖"),
+])
+page.run()